@@ -1,24 +1,34 @@
+import atexit
+import contextlib
 import os
 import tempfile
 
+# Let PyTorch's CUDA allocator grow and reuse memory segments between clicks instead of
+# fragmenting them. Must be set before torch is imported (by summarizer); an existing
+# PYTORCH_CUDA_ALLOC_CONF from the environment wins.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
+
 import gradio as gr
-from summarizer import TextSummarizer, compute_length_reduction
+from summarizer import MODEL_CHOICES, PRUNED_BART_DIR, TextSummarizer, compute_length_reduction, read_text
+
+
+# One long-lived summarizer per (model, precision, GPU), so repeated clicks reuse the warm pipeline
+PIPELINES: dict[tuple[str, str, bool], TextSummarizer] = {}
 
 
-def build_model_name(choice: str) -> str:
+def get_summarizer(model_name: str, dtype: str = "fp32", use_gpu: bool = True) -> TextSummarizer:
     """
-    Map a simple choice ('bart', 'distilbart', 't5') to a Hugging Face model id.
+    Return the shared TextSummarizer for these settings, creating it on first use.
     """
-    choice = choice.lower()
-    if choice == "bart":
-        return "facebook/bart-large-cnn"
-    elif choice == "distilbart":
-        return "sshleifer/distilbart-cnn-12-6"
-    elif choice == "t5":
-        return "t5-small"
-    else:
-        # default fallback
-        return "facebook/bart-large-cnn"
+    key = (model_name, dtype, use_gpu)
+
+    # Keep at most one model on the GPU: free the others before loading a new one
+    for other in [k for k, ts in PIPELINES.items() if k != key and ts.device >= 0]:
+        PIPELINES.pop(other).close()
+
+    if key not in PIPELINES:
+        PIPELINES[key] = TextSummarizer(model_name=model_name, dtype=dtype, use_gpu=use_gpu)
+    return PIPELINES[key]
 
 
 def _write_summary_to_temp_file(summary_text: str) -> str | None:
@@ -29,49 +39,63 @@ def _write_summary_to_temp_file(summary_text: str) -> str | None:
     if not summary_text or not summary_text.strip():
         return None
 
-    temp_dir = tempfile.mkdtemp()
-    file_path = os.path.join(temp_dir, "summary.txt")
-
-    with open(file_path, "w", encoding="utf-8") as f:
+    # One temp file per download (no extra directory), removed when the app exits
+    with tempfile.NamedTemporaryFile(
+        mode="w", encoding="utf-8", prefix="summary_", suffix=".txt", delete=False
+    ) as f:
         f.write(summary_text)
 
-    return file_path
+    atexit.register(_remove_file, f.name)
+    return f.name
+
+
+def _remove_file(path: str) -> None:
+    """
+    Delete a file if it still exists (used for temp files at exit).
+    """
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
 
 
-def summarize_interface(text, file_path, model_choice, max_len, min_len, creative_mode):
+def summarize_interface(text, file_path, model_choice, precision, use_gpu, max_len, min_len, creative_mode, num_beams):
     """
     Main function used by the Gradio UI.
     Decides input source (file > text), runs the summarizer,
-    returns summary text, stats, and an update to show/hide the download button.
+    yields the summary as it is generated, then the final summary, stats,
+    and an update to show/hide the download button.
     """
     # 1) Decide source of text: file has priority over text box
     if file_path:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                text_content = f.read()
+            text_content = read_text(file_path)
         except Exception as e:
             # Error case → hide download button
-            return f"Error reading file: {e}", "", gr.update(visible=False)
+            yield f"Error reading file: {e}", "", gr.update(visible=False)
+            return
     else:
         text_content = text or ""
 
     if not text_content.strip():
         # No valid input → hide download button
-        return "Please enter some text or upload a .txt file.", "", gr.update(visible=False)
+        yield "Please enter some text or upload a .txt file.", "", gr.update(visible=False)
+        return
 
     # 2) Map model choice
-    model_name = build_model_name(model_choice)
+    model_name = MODEL_CHOICES[model_choice]
+
+    # 3) Reuse the warm summarizer for this model
+    ts = get_summarizer(model_name, precision, bool(use_gpu))
 
-    # 3) Build summarizer with chosen settings
-    ts = TextSummarizer(
-        model_name=model_name,
+    # 4) Stream the summary into the textbox (length / sampling are per-call settings)
+    summary = ""
+    for summary in ts.stream(
+        text_content,
         max_length=int(max_len),
         min_length=int(min_len),
-        do_sample=bool(creative_mode)
-    )
-
-    # 4) Generate summary
-    summary = ts.summarize(text_content)
+        do_sample=bool(creative_mode),
+        num_beams=int(num_beams)
+    ):
+        yield summary, "", gr.update(visible=False)
 
     # 5) Compute stats
     orig_len, sum_len, reduction = compute_length_reduction(text_content, summary)
@@ -84,7 +108,7 @@ def summarize_interface(text, file_path, model_choice, max_len, min_len, creativ
     # 6) Just show the download button; file will be created when user clicks it
     download_visibility = gr.update(visible=True)
 
-    return summary, stats, download_visibility
+    yield summary, stats, download_visibility
 
 
 def generate_download_file(summary_text: str):
@@ -154,7 +178,8 @@ with gr.Blocks(title="BrieflyAI – Text Summarizer") as demo:
                 gr.Markdown("### ⚙️ Settings")
 
                 model_choice = gr.Dropdown(
-                    choices=["bart", "distilbart", "t5"],
+                    # "bart-fast" only exists after running tools/prune_bart.py
+                    choices=[c for c in MODEL_CHOICES if c != "bart-fast" or os.path.isdir(PRUNED_BART_DIR)],
                     value="bart",
                     label="Model"
                 )
@@ -167,6 +192,9 @@ with gr.Blocks(title="BrieflyAI – Text Summarizer") as demo:
 - **bart** – Full-sized encoder–decoder summarization model (`facebook/bart-large-cnn`).  
   Highest summary quality; heavier and slightly slower.
 
+- **bart-fast** – BART pruned to ~50% of the compute and distilled from `bart-large-cnn`.  
+  Build it once with `python tools/prune_bart.py`; roughly 2× faster than **bart**.
+
 - **distilbart** – Distilled version of BART (`sshleifer/distilbart-cnn-12-6`).  
   Faster and lighter, with a small trade-off in quality.
 
@@ -175,6 +203,17 @@ with gr.Blocks(title="BrieflyAI – Text Summarizer") as demo:
                     """
                 )
 
+                precision = gr.Dropdown(
+                    choices=["fp32", "bf16", "fp16"],
+                    value="fp32",
+                    label="Precision"
+                )
+
+                use_gpu = gr.Checkbox(
+                    value=True,
+                    label="GPU if available"
+                )
+
                 max_len = gr.Slider(
                     minimum=30,
                     maximum=300,
@@ -195,12 +234,20 @@ with gr.Blocks(title="BrieflyAI – Text Summarizer") as demo:
                     label="Creative mode (sampling on)"
                 )
 
+                num_beams = gr.Radio(
+                    choices=[1, 2, 4],
+                    value=4,
+                    label="Quality vs speed (beams)"
+                )
+
                 gr.Markdown(
                     """
 **Summary settings:**
 
+- **Precision** – `fp32` is the safe default; `bf16` is faster on recent CPUs/GPUs, `fp16` is for GPUs only (falls back to `fp32` on CPU).  
 - **Max / Min length** – Control how long the summary can be (in tokens, roughly like words).  
 - **Creative mode** – Enables sampling; summaries may be more varied but slightly less deterministic.
+- **Quality vs speed** – Number of beams searched while generating: `1` is fastest, `4` gives the best summaries.
                     """
                 )
 
@@ -238,7 +285,7 @@ with gr.Blocks(title="BrieflyAI – Text Summarizer") as demo:
         outputs=status_text
     ).then(
         fn=summarize_interface,
-        inputs=[input_text, input_file, model_choice, max_len, min_len, creative_mode],
+        inputs=[input_text, input_file, model_choice, precision, use_gpu, max_len, min_len, creative_mode, num_beams],
         outputs=[summary_output, stats_output, download_btn]
     ).then(
         fn=clear_status,
@@ -254,4 +301,6 @@ with gr.Blocks(title="BrieflyAI – Text Summarizer") as demo:
     )
 
 if __name__ == "__main__":
+    # Load and warm up the default model before serving, so the first click is not slow
+    get_summarizer(MODEL_CHOICES[model_choice.value], precision.value, use_gpu.value).warmup()
     demo.launch()
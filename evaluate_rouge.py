@@ -1,12 +1,19 @@
-import argparse, nltk, evaluate
-from summarizer import TextSummarizer
+import argparse, nltk, os
+from typing import Dict, List
+
+from rouge_score import rouge_scorer
+from summarizer import MODEL_CHOICES, TextSummarizer
 
 
 # Ensures sentence tokenizer exists that is used for ROUGE-Lsum 
+# Downloaded once into a persistent folder (override with the NLTK_DATA env var)
+# NLTK_DATA may list several folders (separated like PATH); downloads go to the first one
+NLTK_DATA = (os.environ.get("NLTK_DATA") or os.path.expanduser("~/.cache/nltk")).split(os.pathsep)[0]
+nltk.data.path.insert(0, NLTK_DATA)
 try:
     nltk.data.find("tokenizers/punkt")
 except LookupError:
-    nltk.download("punkt")
+    nltk.download("punkt", download_dir=NLTK_DATA, quiet=True)
 
 
 SAMPLE_DATA: List[Dict[str, str]] = [
@@ -53,48 +60,40 @@ SAMPLE_DATA: List[Dict[str, str]] = [
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Evaluate BrieflyAI summarizer with ROUGE.")
-    p.add_argument("--model", default="bart", choices=["bart", "distilbart", "t5"], help="Model choice.")
+    p.add_argument("--model", default="bart", type=str.lower, choices=list(MODEL_CHOICES), help="Model choice.")
     p.add_argument("--max", type=int, default=120, help="Max summary length (tokens).")
     p.add_argument("--min", type=int, default=40, help="Min summary length (tokens).")
     p.add_argument("--do_sample", action="store_true", help="Enable sampling (creative mode).")
+    p.add_argument("--quantize", action="store_true", help="Use an INT8 quantized model (CPU).")
     p.add_argument("--limit", type=int, default=3, help="How many samples from the built-in set to evaluate.")
     return p.parse_args()
 
 
-def build_model_name(choice: str) -> str:
-    choice = choice.lower()
-    if choice == "bart":
-        return "facebook/bart-large-cnn"
-    if choice == "distilbart":
-        return "sshleifer/distilbart-cnn-12-6"
-    if choice == "t5":
-        return "t5-small"
-    return "facebook/bart-large-cnn"
-
-
 def main() -> None:
     args = parse_args()
 
-    model_name = build_model_name(args.model)
+    model_name = MODEL_CHOICES[args.model]
     ts = TextSummarizer(
         model_name=model_name,
         max_length=args.max,
         min_length=args.min,
         do_sample=args.do_sample,
+        quantize=args.quantize,
     )
 
-    rouge = evaluate.load("rouge")
+    rouge_types = ["rouge1", "rouge2", "rougeL", "rougeLsum"]
+    scorer = rouge_scorer.RougeScorer(rouge_types, use_stemmer=True)
 
     samples = SAMPLE_DATA[: max(1, min(args.limit, len(SAMPLE_DATA)))]
-    predictions: List[str] = []
     references: List[str] = []
 
     print(f"\nEvaluating ROUGE for model={args.model} ({model_name}) "
-          f"max={args.max} min={args.min} do_sample={args.do_sample}\n")
+          f"max={args.max} min={args.min} do_sample={args.do_sample} quantize={args.quantize}\n")
 
-    for s in samples:
-        pred = ts.summarize(s["text"])
-        predictions.append(pred)
+    # One batched call for all samples instead of one pipeline call per sample
+    predictions: List[str] = ts.summarize([s["text"] for s in samples], batch_size=len(samples))
+
+    for s, pred in zip(samples, predictions):
         references.append(s["reference"])
 
         print(f"--- {s['id']} ---")
@@ -107,11 +106,12 @@ def main() -> None:
     predictions_lsum = [p.replace(". ", ".\n") for p in predictions]
     references_lsum = [r.replace(". ", ".\n") for r in references]
 
-    results = rouge.compute(
-        predictions=predictions_lsum,
-        references=references_lsum,
-        use_stemmer=True,
-    )
+    # Score each pair, then average the F1 of every ROUGE type over all samples
+    scores = [scorer.score(ref, pred) for ref, pred in zip(references_lsum, predictions_lsum)]
+    results = {
+        t: sum(score[t].fmeasure for score in scores) / len(scores)
+        for t in rouge_types
+    }
 
     # results includes: rouge1, rouge2, rougeL, rougeLsum
     print("ROUGE Results:")
@@ -1,128 +1,140 @@
-from summarizer import TextSummarizer, compute_length_reduction
-import sys
+import argparse
+import glob
 import os #helps us check if an argument is a valid file path.
 
-# Default values
-model_name = "facebook/bart-large-cnn"
-max_length = 60
-min_length = 20
-output_file = None
-
-# Check if user passed a --model flag
-if "--model" in sys.argv:
-    try:
-        model_index = sys.argv.index("--model")
-        selected_model = sys.argv[model_index + 1].lower()
-
-        if selected_model == "bart":
-            model_name = "facebook/bart-large-cnn"
-        elif selected_model == "distilbart":
-            model_name = "sshleifer/distilbart-cnn-12-6"
-        elif selected_model == "t5":
-            model_name = "t5-small"
+from datasets import Dataset
+
+from summarizer import MODEL_CHOICES, TextSummarizer, compute_length_reduction, read_text
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Summarize text with BrieflyAI.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "Usage:\n"
+            "  python summarize_cli.py \"your long text here\"\n"
+            "  python summarize_cli.py path/to/file.txt\n"
+            "  python summarize_cli.py --in_dir path/to/folder --out_dir summaries"
+        )
+    )
+    p.add_argument("input", nargs="*", help="Text to summarize, or a path to a .txt file.")
+    p.add_argument("--model", default="bart", type=str.lower, choices=list(MODEL_CHOICES), help="Model choice.")
+    p.add_argument("--max", type=int, default=60, help="Max summary length (tokens).")
+    p.add_argument("--min", type=int, default=20, help="Min summary length (tokens).")
+    p.add_argument("--out", help="Also write the summary to this file.")
+    p.add_argument("--in_dir", help="Summarize every .txt file in this folder (long files are truncated).")
+    p.add_argument("--out_dir", default="summaries", help="Where --in_dir writes <name>.txt summaries.")
+    p.add_argument("--batch_size", type=int, default=8, help="Files summarized per batch in --in_dir mode.")
+    p.add_argument("--num_workers", type=int, default=0, help="Tokenizer worker processes in --in_dir mode.")
+    # Intermixed so flags may appear between words: hello --max 20 world
+    args = p.parse_intermixed_args()
+
+    if not args.input and not args.in_dir:
+        p.error("give some text, a .txt file, or --in_dir")
+    if args.in_dir:
+        if args.input or args.out:
+            p.error("--in_dir cannot be combined with input text or --out")
+        if not os.path.isdir(args.in_dir):
+            p.error("--in_dir is not a folder")
+    # Summaries are named like their inputs, so writing them next to the inputs would overwrite them
+    if args.in_dir and os.path.isdir(args.out_dir) and os.path.samefile(args.in_dir, args.out_dir):
+        p.error("--out_dir must be a different folder than --in_dir")
+    return args
+
+
+def read_folder(in_dir: str) -> tuple[list[str], list[str]]:
+    """
+    Return the paths and contents of the non-empty .txt files in in_dir.
+    """
+    paths = []
+    texts = []
+    for path in sorted(glob.glob(os.path.join(in_dir, "*.txt"))):
+        text = read_text(path)
+        if text.strip():
+            paths.append(path)
+            texts.append(text)
         else:
-            print(f"Unknown model: {selected_model}")
-            sys.exit(1)
-
-        # Remove the model option from arguments so input_text stays clean
-        del sys.argv[model_index:model_index+2]
-
-    except (IndexError, ValueError):
-        print("Usage: --model <bart|distilbart|t5>")
-        sys.exit(1)
-
-# Check for --max flag (max_length)
-if "--max" in sys.argv:
-    try:
-        max_index = sys.argv.index("--max")
-        max_length = int(sys.argv[max_index + 1])  # convert string to int
-        # Remove the flag and its value from sys.argv
-        
-        del sys.argv[max_index:max_index + 2]
-
-    except (IndexError, ValueError):
-        print("Usage: --max <integer>")
-        sys.exit(1)
-
-# Check for --min flag (min_length)
-if "--min" in sys.argv:
-    try:
-        min_index = sys.argv.index("--min")
-        min_length = int(sys.argv[min_index + 1])  # convert string to 
-        
-        # Remove the flag and its value from sys.argv
-        del sys.argv[min_index:min_index + 2]
-
-    except (IndexError, ValueError):
-        print("Usage: --min <integer>")
-        sys.exit(1)
-
-# Check for --out flag (write summary to a file)
-if "--out" in sys.argv:
-    try:
-        out_index = sys.argv.index("--out")
-        output_file = sys.argv[out_index + 1]
-
-        # Remove the flag and its value from sys.argv
-        del sys.argv[out_index : out_index + 2]
-
-    except (IndexError, ValueError):
-        print("Output file name missing\nUsage: --out <output_filename>")
-        sys.exit(1)
-
-
-# Check if the user provided text as an argument
-if len(sys.argv) < 2:
-    print("Usage: ")
-    print("python summarize_cli.py \"your long text here\"")
-    print ("python summarize_cli.py path/to/file.txt")
-    sys.exit(1)
-
-arg_text= "".join(sys.argv[1:]) #combine everything after the script name into one string
-
-input_text = None
-
-# If there is exactly one argument and it looks like a .txt file, try to read it
-if len(sys.argv) == 2 and sys.argv[1].lower().endswith(".txt") and os.path.isfile(sys.argv[1]):
-    file_path = sys.argv[1]
-    print(f"Reading text from file: {file_path}")
-    with open(file_path, "r", encoding="utf-8") as f:
-        input_text = f.read() #Read the entire contents of the file as a single string.
-else:
-    # Otherwise, treat everything as direct text input
-    input_text = arg_text
-     
-
-# 2) Create a TextSummarizer object
-ts = TextSummarizer(
-    model_name=model_name,
-    max_length=max_length,
-    min_length=min_length,
-    do_sample=False
-)
-
-# 3) Summarize the text
-summary = ts.summarize(input_text)
-orig_len, sum_len, reduction = compute_length_reduction(input_text, summary)
-
-# 4) Print summary
-print("=== STATS ===")
-print(f"Original length: {orig_len} words")
-print(f"Summary length:  {sum_len} words")
-print(f"Reduction:       {reduction * 100:.1f}%")
-
-
-# If the user provided an output file, write summary into it
-if output_file:
-    try:
-        with open(output_file, "w", encoding="utf-8") as f:
+            print(f"Skipping empty file: {path}")
+    return paths, texts
+
+
+def summarize_folder(ts: TextSummarizer, paths: list[str], texts: list[str], args: argparse.Namespace) -> None:
+    """
+    Summarize the given files into args.out_dir/<name>.txt.
+    Files are streamed through the pipeline in batches, so reading/tokenizing
+    the next batch overlaps with summarizing the current one.
+    """
+    os.makedirs(args.out_dir, exist_ok=True)
+    ds = Dataset.from_dict({"text": texts})
+    summaries = ts.summarize_dataset(ds, key="text", batch_size=args.batch_size, num_workers=args.num_workers)
+
+    for path, summary in zip(paths, summaries):
+        out_path = os.path.join(args.out_dir, os.path.basename(path))
+        if os.path.exists(out_path) and os.path.samefile(out_path, path):
+            # e.g. out_dir is a symlink to in_dir: never replace an input with its summary
+            print(f"Skipping {path}: output would overwrite the input file")
+            continue
+        with open(out_path, "w", encoding="utf-8") as f:
             f.write(summary)
-        print(f"\nSummary saved to: {output_file}")
-
-    except Exception as e:
-        print(f"Error writing to file: {e}")
-
-print("\n=== SUMMARY ===")
-print(summary)
-
-
+        print(f"{path} -> {out_path}")
+
+
+def main() -> None:
+    args = parse_args()
+
+    # Folder mode: one summary file per input file
+    if args.in_dir:
+        # Check for input files before spending time loading the model
+        paths, texts = read_folder(args.in_dir)
+        if not paths:
+            print(f"No non-empty .txt files found in: {args.in_dir}")
+            return
+        ts = TextSummarizer(model_name=MODEL_CHOICES[args.model], max_length=args.max, min_length=args.min)
+        summarize_folder(ts, paths, texts, args)
+        return
+
+    # 1) Get the input text
+    # If there is exactly one argument and it looks like a .txt file, read it
+    if len(args.input) == 1 and args.input[0].lower().endswith(".txt") and os.path.isfile(args.input[0]):
+        file_path = args.input[0]
+        print(f"Reading text from file: {file_path}")
+        input_text = read_text(file_path) #Read the entire contents of the file as a single string.
+    else:
+        # Otherwise, treat everything as direct text input (words separated by spaces)
+        input_text = " ".join(args.input)
+
+    # 2) Create a TextSummarizer object
+    ts = TextSummarizer(
+        model_name=MODEL_CHOICES[args.model],
+        max_length=args.max,
+        min_length=args.min,
+        do_sample=False
+    )
+
+    # 3) Summarize the text
+    summary = ts.summarize(input_text)
+    orig_len, sum_len, reduction = compute_length_reduction(input_text, summary)
+
+    # 4) Print summary
+    print("=== STATS ===")
+    print(f"Original length: {orig_len} words")
+    print(f"Summary length:  {sum_len} words")
+    print(f"Reduction:       {reduction * 100:.1f}%")
+
+    # If the user provided an output file, write summary into it
+    if args.out:
+        try:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(summary)
+            print(f"\nSummary saved to: {args.out}")
+
+        except Exception as e:
+            print(f"Error writing to file: {e}")
+
+    print("\n=== SUMMARY ===")
+    print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,286 @@
-from transformers import pipeline
+import gc
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import warnings
+from array import array
+from collections import OrderedDict
+from threading import Lock, Thread
+
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, TextIteratorStreamer, pipeline
+from transformers.pipelines.pt_utils import KeyDataset
+
+# Optional: ONNX Runtime acceleration (pip install "optimum[onnxruntime]")
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+except ImportError:
+    ORTModelForSeq2SeqLM = None
+
+# Optional: INT8 dynamic quantization on CPU (pip install "optimum[neural-compressor]")
+try:
+    from neural_compressor.config import PostTrainingQuantConfig
+    from optimum.intel import INCModelForSeq2SeqLM, INCQuantizer
+except ImportError:
+    INCQuantizer = None
+
+# Optional: OpenVINO inference on Intel CPUs (pip install "optimum[openvino]")
+try:
+    from optimum.intel import OVModelForSeq2SeqLM
+except ImportError:
+    OVModelForSeq2SeqLM = None
+
+# Optional: NVIDIA Model Optimizer, needed to load the pruned "bart-fast" model
+try:
+    import modelopt.torch.opt as mto
+except ImportError:
+    mto = None
+
+# Optional: Intel Extension for PyTorch, speeds up bf16 on recent Intel CPUs
+try:
+    import intel_extension_for_pytorch as ipex
+except ImportError:
+    ipex = None
+
+# Exported / converted models are stored here so they are only built once
+CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "brieflyai")
+
+# Where tools/prune_bart.py saves the pruned + distilled BART ("bart-fast")
+PRUNED_BART_DIR = os.path.join(CACHE_ROOT, "bart-pruned")
+
+# Short model names accepted by the apps -> Hugging Face model id (or local folder)
+MODEL_CHOICES = {
+    "bart": "facebook/bart-large-cnn",
+    "bart-fast": PRUNED_BART_DIR,
+    "distilbart": "sshleifer/distilbart-cnn-12-6",
+    "t5": "t5-small",
+}
+
+BACKENDS = ("pt", "ort", "ov")
+
+# Long inputs are split into overlapping token windows that are summarized in batches
+CHUNK_OVERLAP = 0.2
+CHUNK_BATCH_SIZE = 8
+
+# Token ids of the last few texts, keyed by (tokenizer, text digest) so the documents
+# themselves are not kept alive. Ids are stored as a compact int32 array.
+_TOKEN_CACHE_SIZE = 2
+_TOKEN_CACHE: "OrderedDict[tuple[str, str], array]" = OrderedDict()
+_TOKEN_CACHE_LOCK = Lock()
+
+# Loaded pipelines, keyed by the _get_pipeline() arguments, so new TextSummarizer objects
+# reuse already-loaded weights. At most _PIPELINE_CACHE_SIZE models are kept in memory.
+_PIPELINE_CACHE_SIZE = 4
+_PIPELINES: "OrderedDict[tuple, object]" = OrderedDict()
+_PIPELINES_LOCK = Lock()
+
+# Precision choices for the PyTorch backend
+DTYPES = {
+    "fp32": torch.float32,
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+}
+
+
+def _cache_dir(kind: str, model_name: str) -> str:
+    """
+    Folder for a converted copy of a model, e.g. ~/.cache/brieflyai/onnx/facebook--bart-large-cnn
+    """
+    return os.path.join(CACHE_ROOT, kind, model_name.replace("/", "--"))
+
+
+def _newer_than(model_name: str, timestamp: float) -> bool:
+    """
+    True if model_name is a local folder containing a file modified after timestamp.
+    Hub model ids are never considered newer.
+    """
+    if not os.path.isdir(model_name):
+        return False
+    return any(
+        os.path.getmtime(os.path.join(root, f)) > timestamp
+        for root, _, files in os.walk(model_name)
+        for f in files
+    )
+
+
+def _cached_export(kind: str, model_name: str, build) -> str:
+    """
+    Return the cache folder for a converted copy of a model, building it first if needed.
+    build(folder) writes the converted model into a temporary folder that is only renamed
+    into place once complete, so an interrupted first run never leaves a broken cache.
+    Exports of a local model folder are rebuilt when the folder has newer files
+    (e.g. after re-running tools/prune_bart.py).
+    """
+    target = _cache_dir(kind, model_name)
+    marker = os.path.join(target, "config.json")
+    if os.path.isfile(marker) and not _newer_than(model_name, os.path.getmtime(marker)):
+        return target
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(target))
+    try:
+        build(tmp)
+        shutil.rmtree(target, ignore_errors=True)  # leftovers of an interrupted older run
+        os.replace(tmp, target)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return target
+
+
+def _resolve_backend(backend: str | None) -> str:
+    """
+    None means "use ONNX Runtime if optimum is installed, otherwise PyTorch".
+    """
+    if backend is None:
+        return "ort" if ORTModelForSeq2SeqLM is not None else "pt"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+    if backend == "ort" and ORTModelForSeq2SeqLM is None:
+        raise ImportError('ONNX Runtime backend needs optimum: pip install "optimum[onnxruntime]"')
+    if backend == "ov" and OVModelForSeq2SeqLM is None:
+        raise ImportError('OpenVINO backend needs optimum-intel: pip install "optimum[openvino]"')
+    return backend
+
+
+def _load_ort_model(model_name: str):
+    """
+    Load the ONNX export of a model, exporting it on the first run only.
+    """
+    def export(folder):
+        ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True).save_pretrained(folder)
+
+    return ORTModelForSeq2SeqLM.from_pretrained(_cached_export("onnx", model_name, export))
+
+
+def _load_ov_model(model_name: str, int8: bool = False):
+    """
+    Load the OpenVINO IR of a model, exporting it on the first run only.
+    With int8=True the weights are compressed to 8 bits with NNCF during export.
+    """
+    def export(folder):
+        OVModelForSeq2SeqLM.from_pretrained(model_name, export=True, load_in_8bit=int8).save_pretrained(folder)
+
+    return OVModelForSeq2SeqLM.from_pretrained(_cached_export("ov-int8" if int8 else "ov", model_name, export))
+
+
+def _load_int8_model(model_name: str):
+    """
+    Load an INT8 (dynamically quantized) copy of a model, quantizing it on the first run only.
+    """
+    if INCQuantizer is None:
+        raise ImportError('INT8 quantization needs optimum-intel: pip install "optimum[neural-compressor]"')
+
+    def quantize(folder):
+        # Dynamic quantization needs no calibration data: weights are stored as int8,
+        # activations are quantized on the fly at inference time
+        quantizer = INCQuantizer.from_pretrained(AutoModelForSeq2SeqLM.from_pretrained(model_name))
+        quantizer.quantize(
+            quantization_config=PostTrainingQuantConfig(approach="dynamic"),
+            save_directory=folder
+        )
+
+    return INCModelForSeq2SeqLM.from_pretrained(_cached_export("int8", model_name, quantize))
+
+
+def _tokenize(tokenizer, text: str) -> array:
+    """
+    Token ids of text (no special tokens), cached so re-summarizing the same text
+    with different settings skips tokenization. Callers must not modify the result.
+    """
+    key = (tokenizer.name_or_path, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest())
+    with _TOKEN_CACHE_LOCK:
+        ids = _TOKEN_CACHE.pop(key, None)
+    if ids is None:
+        ids = array("i", tokenizer(text, add_special_tokens=False, verbose=False)["input_ids"])
+
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = ids  # (re)insert as most recently used
+        while len(_TOKEN_CACHE) > _TOKEN_CACHE_SIZE:
+            _TOKEN_CACHE.popitem(last=False)
+    return ids
+
+
+def _bucket_and_batch(sequences: list[list[int]], max_padding_ratio: float = 1.3) -> list[list[int]]:
+    """
+    Group token sequences (by index) into buckets of similar length.
+    Inside a bucket the longest sequence is at most max_padding_ratio times the shortest,
+    so batching a bucket wastes little compute on padding tokens.
+    """
+    order = sorted(range(len(sequences)), key=lambda i: len(sequences[i]))
+
+    buckets: list[list[int]] = []
+    for i in order:
+        # Sorted ascending, so the bucket's first entry is its shortest sequence
+        if buckets and len(sequences[i]) <= max(len(sequences[buckets[-1][0]]), 1) * max_padding_ratio:
+            buckets[-1].append(i)
+        else:
+            buckets.append([i])
+    return buckets
+
+
+def _get_pipeline(model_name: str,
+                  backend: str = "pt",
+                  quantize: bool = False,
+                  dtype: str = "fp32",
+                  device: int = -1):
+    """
+    Return the Hugging Face summarization pipeline for a model, building it on first use.
+    Cached at module level so new TextSummarizer objects reuse already-loaded weights
+    instead of reading them from disk again. The least recently used model is dropped
+    once more than _PIPELINE_CACHE_SIZE are cached.
+    """
+    key = (model_name, backend, quantize, dtype, device)
+    with _PIPELINES_LOCK:
+        summarizer = _PIPELINES.pop(key, None)
+        if summarizer is None:
+            summarizer = _build_pipeline(*key)
+        _PIPELINES[key] = summarizer  # (re)insert as most recently used
+        while len(_PIPELINES) > _PIPELINE_CACHE_SIZE:
+            _PIPELINES.popitem(last=False)
+    return summarizer
+
+
+def _build_pipeline(model_name: str, backend: str, quantize: bool, dtype: str, device: int):
+    """
+    Load the model for _get_pipeline() with the requested backend, precision and device.
+    """
+    if model_name == PRUNED_BART_DIR:
+        if not os.path.isdir(PRUNED_BART_DIR):
+            raise FileNotFoundError(
+                f'The "bart-fast" model was not found in {PRUNED_BART_DIR}. '
+                "Build it first with: python tools/prune_bart.py"
+            )
+        if mto is None:
+            raise ImportError('The pruned "bart-fast" model needs NVIDIA Model Optimizer: pip install nvidia-modelopt')
+        # Lets from_pretrained (and the ONNX / OpenVINO exporters) rebuild the pruned
+        # layer shapes from the saved modelopt state instead of the unpruned config
+        mto.enable_huggingface_checkpointing()
+
+    if backend == "ov":
+        # OpenVINO fuses ops and picks CPU-friendly layouts; quantize adds int8 weights
+        model = _load_ov_model(model_name, int8=quantize)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+    if quantize:
+        model = _load_int8_model(model_name)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+    if backend == "ort":
+        # ONNX Runtime applies graph optimizations (op fusion, constant folding)
+        model = _load_ort_model(model_name)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+    # PyTorch: load the weights directly in the requested precision, on GPU 0 or CPU (-1)
+    summarizer = pipeline("summarization", model=model_name, dtype=DTYPES[dtype], device=device)
+    if device < 0 and dtype == "bf16" and ipex is not None:
+        summarizer.model = ipex.optimize(summarizer.model.eval(), dtype=torch.bfloat16)
+    return summarizer
+
 
 class TextSummarizer:
     #constructor - special method that runs automatically when you create an object
@@ -6,38 +288,319 @@ class TextSummarizer:
                  model_name: str = "facebook/bart-large-cnn",
                  max_length: int = 60, # :int is a type hint -> not required but helpful for readability
                  min_length: int = 20,
-                 do_sample: bool = False):
+                 do_sample: bool = False,
+                 backend: str | None = None,
+                 quantize: bool = False,
+                 dtype: str = "fp32",
+                 use_gpu: bool = True):
         """
         Initialize the summarization pipeline.
+        backend: "pt" (PyTorch), "ort" (ONNX Runtime), "ov" (OpenVINO) or None to pick:
+                 PyTorch on a GPU, otherwise ONNX Runtime when available.
+        quantize: use an INT8 model (CPU speed-up, small ROUGE drop): dynamic quantization
+                  with the PyTorch backend, NNCF weight compression with OpenVINO.
+        dtype: "fp32", "fp16" or "bf16" weights for the PyTorch backend
+               (fp16 needs a GPU; without one it falls back to fp32 with a warning).
+        use_gpu: run the PyTorch backend on the first CUDA GPU when one is available.
         """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown dtype: {dtype} (expected one of {tuple(DTYPES)})")
+
+        gpu = use_gpu and torch.cuda.is_available()
+        # Half precision on CPU is much slower than fp32, not faster
+        if dtype == "fp16" and not gpu:
+            warnings.warn("fp16 needs a GPU; running in fp32 on CPU instead.")
+            dtype = "fp32"
+
         self.model_name = model_name
         self.max_length = max_length
         self.min_length = min_length
         self.do_sample = do_sample
+        self.quantize = quantize
+        self.dtype = dtype
+        # INT8 and reduced-precision models are run by PyTorch (or OpenVINO for INT8),
+        # not ONNX Runtime; with a GPU available PyTorch is used so the GPU is not left idle
+        self.backend = "pt" if (quantize or dtype != "fp32" or gpu) and backend is None else _resolve_backend(backend)
+        if dtype != "fp32" and self.backend != "pt":
+            raise ValueError("dtype is only supported with the PyTorch backend.")
+        if quantize and self.backend == "ort":
+            raise ValueError("quantize=True is supported with the PyTorch and OpenVINO backends.")
+        if quantize and dtype != "fp32":
+            raise ValueError("quantize=True already uses int8 weights; leave dtype as 'fp32'.")
 
-        # Load the Hugging Face summarization pipeline
-        self._pipeline = pipeline(
-            "summarization",
-            model=self.model_name
-        )
+        # ONNX Runtime / OpenVINO / INT8 models run on CPU; PyTorch uses the GPU when there is one
+        self.device = 0 if gpu and self.backend == "pt" and not quantize else -1
+
+        # Get the (cached) Hugging Face summarization pipeline
+        self._pipeline = _get_pipeline(self.model_name, self.backend, self.quantize, self.dtype, self.device)
 
-    def summarize(self, text: str) -> str:
+    def summarize(self,
+                  text: str | list[str],
+                  max_length: int | None = None,
+                  min_length: int | None = None,
+                  do_sample: bool | None = None,
+                  batch_size: int = CHUNK_BATCH_SIZE,
+                  num_beams: int | None = None) -> str | list[str]:
         """
         Summarize the given text and return the summary string.
+        A list of texts is summarized in batches and returns a list of summaries.
+        max_length / min_length / do_sample override the values given to the
+        constructor for this call only (they are generation settings, no reload needed).
+        num_beams: 1 is greedy decoding (fastest), more beams trade speed for quality;
+        None keeps the model's default (4 for BART).
         """
-        if not text or not text.strip():
+        self._check_open()
+        texts = [text] if isinstance(text, str) else list(text)
+        if not texts or any(not t or not t.strip() for t in texts):
             raise ValueError("Input text is empty.")
 
-        result = self._pipeline(
-            text,
+        # Text longer than the model's input limit is split instead of being cut off.
+        # owners[i] remembers which input text chunk i belongs to.
+        chunks = []
+        owners = []
+        for i, t in enumerate(texts):
+            for chunk in self._split_into_chunks(t):
+                chunks.append(chunk)
+                owners.append(i)
+
+        # Put the chunk summaries back in reading order
+        chunk_summaries = [""] * len(chunks)
+        batches = self._summarize_chunks(
+            chunks,
+            batch_size,
+            max_length=self.max_length if max_length is None else max_length,
+            min_length=self.min_length if min_length is None else min_length,
+            do_sample=self.do_sample if do_sample is None else do_sample,
+            num_beams=num_beams
+        )
+        for batch, decoded in batches:
+            for i, summary in zip(batch, decoded):
+                chunk_summaries[i] = summary
+
+        # Join the chunk summaries per input text
+        parts: list[list[str]] = [[] for _ in texts]
+        for owner, chunk_summary in zip(owners, chunk_summaries):
+            parts[owner].append(chunk_summary)
+        summaries = [" ".join(p) for p in parts]
+
+        return summaries[0] if isinstance(text, str) else summaries
+
+    def summarize_dataset(self,
+                          dataset,
+                          key: str = "text",
+                          batch_size: int = CHUNK_BATCH_SIZE,
+                          num_workers: int = 0):
+        """
+        Yield one summary per row of a datasets.Dataset, in order.
+        The pipeline streams the rows through a DataLoader, so tokenization of the next
+        batch (in num_workers processes) overlaps with generation for the current one.
+        Inputs longer than the model limit are truncated, not chunked.
+        """
+        self._check_open()
+        outputs = self._pipeline(
+            KeyDataset(dataset, key),
+            batch_size=batch_size,
+            num_workers=num_workers,
             max_length=self.max_length,
+            max_new_tokens=None,  # max_length is the limit, not the pipeline default
             min_length=self.min_length,
             do_sample=self.do_sample,
             truncation=True
         )
+        for out in outputs:
+            yield out[0]["summary_text"].strip()
+
+    def stream(self,
+               text: str,
+               max_length: int | None = None,
+               min_length: int | None = None,
+               do_sample: bool | None = None,
+               num_beams: int | None = None):
+        """
+        Summarize text and yield the summary-so-far while it is being generated.
+        Greedy decoding / sampling streams token by token; beam search (which streamers
+        do not support) summarizes the chunks in batches like summarize() and yields
+        after each batch.
+        """
+        self._check_open()
+        if not text or not text.strip():
+            raise ValueError("Input text is empty.")
+
+        tokenizer = self._pipeline.tokenizer
+        generate_kwargs = dict(
+            max_length=self.max_length if max_length is None else max_length,
+            min_length=self.min_length if min_length is None else min_length,
+            do_sample=self.do_sample if do_sample is None else do_sample,
+            num_beams=num_beams
+        )
+        if num_beams is None:
+            generation_config = (getattr(self._pipeline, "generation_config", None)
+                                 or self._pipeline.model.generation_config)
+            num_beams = generation_config.num_beams or 1
+
+        chunks = self._split_into_chunks(text)
+        if num_beams > 1:
+            # Show the chunks finished so far, in reading order
+            chunk_summaries = [""] * len(chunks)
+            for batch, decoded in self._summarize_chunks(chunks, CHUNK_BATCH_SIZE, **generate_kwargs):
+                for i, piece in zip(batch, decoded):
+                    chunk_summaries[i] = piece
+                yield " ".join(p for p in chunk_summaries if p)
+            return
+
+        summary = ""
+        for chunk in chunks:
+            # generate() runs in a background thread and pushes text pieces into the streamer
+            streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True)
+            errors = []
+
+            def run(chunk=chunk, streamer=streamer):
+                try:
+                    self._generate([chunk], streamer=streamer, **generate_kwargs)
+                except Exception as e:
+                    # Unblock the loop below, then re-raise in this thread
+                    errors.append(e)
+                    streamer.end()
+
+            thread = Thread(target=run)
+            thread.start()
+            piece = ""
+            for new_text in streamer:
+                piece += new_text
+                yield f"{summary} {piece.strip()}".strip()
+            thread.join()
+            if errors:
+                raise errors[0]
+            summary = f"{summary} {piece.strip()}".strip()
+
+    def warmup(self) -> "TextSummarizer":
+        """
+        Run one tiny summary so lazy initialization (CUDA kernels, allocator pools)
+        happens now instead of on the user's first request. Returns self.
+        """
+        self.summarize("warmup text.", max_length=10, min_length=5)
+        return self
+
+    def close(self):
+        """
+        Drop this summarizer's model from the pipeline cache and hand cached GPU memory
+        back to the driver. The memory is only freed once no other TextSummarizer uses
+        the same model. The summarizer cannot be used after close().
+        """
+        key = (self.model_name, self.backend, self.quantize, self.dtype, self.device)
+        with _PIPELINES_LOCK:
+            if _PIPELINES.get(key) is self._pipeline:
+                del _PIPELINES[key]
+        self._pipeline = None
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def _check_open(self):
+        """
+        Raise a clear error instead of failing deep inside generation after close().
+        """
+        if self._pipeline is None:
+            raise RuntimeError("This TextSummarizer has been closed; create a new one to summarize again.")
+
+    def _summarize_chunks(self, chunks: list[list[int]], batch_size: int, **generate_kwargs):
+        """
+        Summarize token-id chunks in batches of similar length, so little compute is
+        spent on padding. Yields (chunk indices, decoded summaries) after each batch.
+        """
+        tokenizer = self._pipeline.tokenizer
+        for bucket in _bucket_and_batch(chunks):
+            for b in range(0, len(bucket), batch_size):
+                batch = bucket[b:b + batch_size]
+                output_ids = self._generate([chunks[i] for i in batch], **generate_kwargs)
+                decoded = tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+                yield batch, [d.strip() for d in decoded]
+
+    def _generate(self, chunks: list[list[int]], **generate_kwargs):
+        """
+        Pad a batch of token-id chunks and run model.generate on it directly,
+        skipping the pipeline's own (re-)tokenization.
+        """
+        tokenizer = self._pipeline.tokenizer
+        model = self._pipeline.model
+
+        inputs = tokenizer.pad(
+            {"input_ids": [tokenizer.build_inputs_with_special_tokens(c) for c in chunks]},
+            return_tensors="pt"
+        )
+        # The caller's max_length is the limit, not the pipeline's max_new_tokens default
+        if "max_length" in generate_kwargs:
+            generate_kwargs.setdefault("max_new_tokens", None)
+
+        # None means "use the model's default beam count"
+        if generate_kwargs.get("num_beams") is None:
+            generate_kwargs.pop("num_beams", None)
+        elif generate_kwargs["num_beams"] > 1:
+            # Stop a beam search once every beam has finished
+            generate_kwargs.setdefault("early_stopping", True)
+
+        # Reuse the decoder's past keys/values instead of recomputing attention every step
+        generate_kwargs.setdefault("use_cache", True)
+
+        # The pipeline keeps the task defaults (e.g. beam count) in its own generation config.
+        # inference_mode skips autograd bookkeeping, which generation never needs.
+        with torch.inference_mode():
+            return model.generate(
+                input_ids=inputs["input_ids"].to(model.device),
+                attention_mask=inputs["attention_mask"].to(model.device),
+                generation_config=getattr(self._pipeline, "generation_config", None),
+                **generate_kwargs
+            )
+
+    def _split_into_chunks(self, text: str) -> list[list[int]]:
+        """
+        Split text into overlapping token-id windows that each fit in the model's input.
+        Every window starts with the task prefix (e.g. "summarize: " for T5).
+        Short texts come back as a single chunk.
+        """
+        tokenizer = self._pipeline.tokenizer
+        config = self._pipeline.model.config
+
+        # The pipeline moves the task prefix out of task_specific_params onto itself,
+        # so config.prefix is usually None here
+        prefix = getattr(self._pipeline, "prefix", None) or ""
+        # The prefix is tiny, so it is not worth a slot in the token cache
+        prefix_ids = tokenizer(prefix, add_special_tokens=False)["input_ids"] if prefix else []
+
+        # BART has max_position_embeddings; T5 only exposes the limit on its tokenizer
+        max_tokens = getattr(config, "max_position_embeddings", None) or tokenizer.model_max_length
+        # Leave room for special tokens and the prefix
+        window = max_tokens - tokenizer.num_special_tokens_to_add() - len(prefix_ids)
+
+        ids = _tokenize(tokenizer, text)
+        if len(ids) <= window:
+            return [prefix_ids + list(ids)]
+
+        stride = int(window * (1 - CHUNK_OVERLAP))
+        chunks = []
+        start = 0
+        while True:
+            chunks.append(prefix_ids + list(ids[start:start + window]))
+            if start + window >= len(ids):
+                break
+            start += stride
+        return chunks
+
+
+def read_text(path: str) -> str:
+    """
+    Read a UTF-8 text file. The file is memory-mapped and decoded straight from the
+    mapping, so large files are not copied through Python's file buffers first.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+    # Same newline handling as text-mode open(): Windows/old-Mac line endings become "\n"
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
 
-        return result[0]["summary_text"]
-    
 def compute_length_reduction(original: str, summary: str):
 
     orig_len = len(original.split()) #word count of original text
@@ -0,0 +1,150 @@
+"""
+Build the "bart-fast" model: prune facebook/bart-large-cnn to ~50% of its FLOPs
+with NVIDIA Model Optimizer (GradNAS), then recover quality by distilling from the
+original model on CNN/DailyMail. This is a one-time offline job (GPU recommended).
+
+    pip install nvidia-modelopt
+    python tools/prune_bart.py --train_samples 20000 --epochs 1
+
+The result is saved where the apps look for "bart-fast" (~/.cache/brieflyai/bart-pruned).
+Pruned layers have per-layer sizes that config.json cannot describe, so loading the
+model also needs nvidia-modelopt installed (summarizer.py takes care of the rest).
+Inputs are padded to a fixed 1024 tokens, matching how the model is deployed.
+"""
+import argparse
+import copy
+import os
+
+import torch
+import torch.nn.functional as F
+from datasets import load_dataset
+from torch.utils.data import DataLoader
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+# Same folder as summarizer.PRUNED_BART_DIR
+DEFAULT_OUT = os.path.join(os.path.expanduser("~"), ".cache", "brieflyai", "bart-pruned")
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Prune + distill BART into the 'bart-fast' deployment model.")
+    p.add_argument("--teacher", default="facebook/bart-large-cnn", help="Model to prune and distill from.")
+    p.add_argument("--flops", default="50%", help="FLOPs the pruned model may keep (modelopt constraint).")
+    p.add_argument("--train_samples", type=int, default=20000, help="CNN/DailyMail articles used for distillation.")
+    p.add_argument("--epochs", type=int, default=1, help="Distillation epochs.")
+    p.add_argument("--batch_size", type=int, default=4, help="Training batch size.")
+    p.add_argument("--lr", type=float, default=5e-5, help="Learning rate.")
+    p.add_argument("--temperature", type=float, default=2.0, help="Softmax temperature for distillation.")
+    p.add_argument("--alpha", type=float, default=0.5, help="Weight of the label loss vs the distillation loss.")
+    p.add_argument("--max_input", type=int, default=1024, help="Fixed input length (tokens).")
+    p.add_argument("--max_target", type=int, default=142, help="Max reference summary length (tokens).")
+    p.add_argument("--out", default=DEFAULT_OUT, help="Where to save the pruned model.")
+    return p.parse_args()
+
+
+def build_loader(tokenizer, args: argparse.Namespace) -> DataLoader:
+    """
+    CNN/DailyMail articles -> fixed-length input ids, reference highlights -> labels.
+    """
+    ds = load_dataset("cnn_dailymail", "3.0.0", split=f"train[:{args.train_samples}]")
+
+    def encode(batch):
+        enc = tokenizer(batch["article"], max_length=args.max_input, padding="max_length", truncation=True)
+        labels = tokenizer(text_target=batch["highlights"], max_length=args.max_target,
+                           padding="max_length", truncation=True)["input_ids"]
+        # Padding in the labels is ignored by the loss
+        enc["labels"] = [[t if t != tokenizer.pad_token_id else -100 for t in seq] for seq in labels]
+        return enc
+
+    ds = ds.map(encode, batched=True, remove_columns=ds.column_names)
+    ds.set_format("torch")
+    return DataLoader(ds, batch_size=args.batch_size, shuffle=True)
+
+
+def prune(model, loader: DataLoader, args: argparse.Namespace, device: str):
+    """
+    GradNAS pruning: rank attention heads / FFN channels by gradient-based importance
+    and drop the least important ones until the FLOPs constraint is met.
+    """
+    try:
+        import modelopt.torch.opt as mto
+        import modelopt.torch.prune as mtp
+    except ImportError:
+        raise SystemExit("Pruning needs NVIDIA Model Optimizer: pip install nvidia-modelopt")
+
+    # Makes save_pretrained() also write the pruned layer shapes (modelopt_state.pth),
+    # which from_pretrained() needs to rebuild the smaller model
+    mto.enable_huggingface_checkpointing()
+
+    def collect_func(batch):
+        return {k: v.to(device) for k, v in batch.items()}
+
+    dummy = collect_func(next(iter(loader)))
+    model, _ = mtp.prune(
+        model=model,
+        mode="gradnas",
+        constraints={"flops": args.flops},
+        dummy_input=(dummy,),
+        config={
+            "data_loader": loader,
+            "collect_func": collect_func,
+            "loss_func": lambda output, batch: output.loss,
+        },
+    )
+    return model
+
+
+def distill(student, teacher, loader: DataLoader, args: argparse.Namespace, device: str) -> None:
+    """
+    Fine-tune the pruned student on the reference summaries while matching the teacher's
+    (temperature-softened) token distributions.
+    """
+    optimizer = torch.optim.AdamW(student.parameters(), lr=args.lr)
+    t = args.temperature
+    student.train()
+
+    for epoch in range(args.epochs):
+        for step, batch in enumerate(loader):
+            batch = {k: v.to(device) for k, v in batch.items()}
+            with torch.no_grad():
+                teacher_logits = teacher(**batch).logits
+            out = student(**batch)
+
+            # Only compare positions that hold a real target token
+            mask = batch["labels"] != -100
+            kd_loss = F.kl_div(
+                F.log_softmax(out.logits[mask] / t, dim=-1),
+                F.softmax(teacher_logits[mask] / t, dim=-1),
+                reduction="batchmean",
+            ) * (t * t)
+            loss = args.alpha * out.loss + (1 - args.alpha) * kd_loss
+
+            loss.backward()
+            optimizer.step()
+            optimizer.zero_grad()
+
+            if step % 100 == 0:
+                print(f"epoch {epoch} step {step}: loss={loss.item():.4f} (label={out.loss.item():.4f}, kd={kd_loss.item():.4f})")
+
+
+def main() -> None:
+    args = parse_args()
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    tokenizer = AutoTokenizer.from_pretrained(args.teacher)
+    teacher = AutoModelForSeq2SeqLM.from_pretrained(args.teacher).to(device).eval()
+    loader = build_loader(tokenizer, args)
+
+    print(f"Pruning {args.teacher} to {args.flops} FLOPs...")
+    student = prune(copy.deepcopy(teacher), loader, args, device)
+
+    print("Distilling from the full model...")
+    distill(student, teacher, loader, args, device)
+
+    student.eval()
+    student.save_pretrained(args.out)
+    tokenizer.save_pretrained(args.out)
+    print(f"\nSaved pruned model to: {args.out}  (use it with --model bart-fast)")
+
+
+if __name__ == "__main__":
+    main()